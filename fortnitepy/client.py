@@ -59,6 +59,9 @@ AnyCallable = Union[Callable, Awaitable]
 StrOrInt = Union[str, int]
 Datetime = datetime.datetime
 
+# Seconds a fetched friends summary is reused for mutual friends lookups.
+_MUTUAL_FRIENDS_COUNTS_TTL = 10
+
 
 # all credit for this function goes to discord.py.
 def _cancel_tasks(loop: asyncio.AbstractEventLoop) -> None:
@@ -477,6 +480,10 @@ class Client:
         self._users = Cache()
         self._blocked_users = Cache()
         self._presences = Cache()
+        self._mutual_friends_counts = None
+        self._mutual_friends_counts_expires = 0
+        self._mutual_friends_task = None
+        self._last_logouts_task = None
         self._ready = asyncio.Event(loop=self.loop)
         self._leave_lock = asyncio.Lock(loop=self.loop)
         self._join_party_lock = asyncio.Lock(loop=self.loop)
@@ -904,6 +911,13 @@ class Client:
         self._users.clear()
         self._blocked_users.clear()
         self._presences.clear()
+        self._mutual_friends_counts = None
+        if self._mutual_friends_task is not None:
+            self._mutual_friends_task.cancel()
+            self._mutual_friends_task = None
+        if self._last_logouts_task is not None:
+            self._last_logouts_task.cancel()
+            self._last_logouts_task = None
         self._ready.clear()
 
         if close_http:
@@ -1359,18 +1373,102 @@ class Client:
             if friend is not None:
                 friend._update_summary(data)
 
-        for user_id, data in raw_presences.items():
-            friend = self.get_friend(user_id)
-            if friend is not None:
-                friend._update_last_logout(
-                    self.from_iso(data[0]['last_online'])
-                )
+        self._update_mutual_friends_counts(raw_summary)
+
+        self._update_last_logouts(raw_presences)
 
         for data in raw_summary['blocklist']:
             user = profiles.get(data['accountId'])
             if user is not None:
                 self.store_blocked_user(user)
 
+    def _update_mutual_friends_counts(self, summary: dict) -> Dict[str, int]:
+        counts = {f['accountId']: f['mutual'] for f in summary['friends']}
+        self._mutual_friends_counts = counts
+        self._mutual_friends_counts_expires = (self.loop.time()
+                                               + _MUTUAL_FRIENDS_COUNTS_TTL)
+        return counts
+
+    async def _fetch_mutual_friends_counts(self) -> Dict[str, int]:
+        data = await self.http.friends_get_summary()
+        return self._update_mutual_friends_counts(data)
+
+    async def _fetch_mutual_friends_count(self, user_id: str) -> Optional[int]:
+        counts = self._mutual_friends_counts
+        if (counts is not None
+                and user_id in counts
+                and self.loop.time() < self._mutual_friends_counts_expires):
+            return counts[user_id]
+
+        # Either the map is stale or it was built before this friend was
+        # added, so fetch a fresh summary. Concurrent misses share the
+        # same request.
+        task = self._mutual_friends_task
+        if task is None:
+            task = self.loop.create_task(self._fetch_mutual_friends_counts())
+            task.add_done_callback(self._clear_mutual_friends_task)
+            self._mutual_friends_task = task
+
+        counts = await asyncio.shield(task)
+        return counts.get(user_id)
+
+    def _clear_mutual_friends_task(self, task: asyncio.Task) -> None:
+        if self._mutual_friends_task is task:
+            self._mutual_friends_task = None
+
+    def _update_last_logouts(self, presences: dict) -> Dict[str, Datetime]:
+        from_iso = self.from_iso
+        logouts = {}
+        for user_id, data in presences.items():
+            dt = from_iso(data[0]['last_online'])
+            logouts[user_id] = dt
+
+            friend = self.get_friend(user_id)
+            if friend is not None:
+                friend._update_last_logout(dt)
+
+        return logouts
+
+    async def _fetch_all_last_logouts(self) -> Dict[str, Datetime]:
+        presences = await self.http.presence_get_last_online()
+        return self._update_last_logouts(presences)
+
+    async def fetch_all_last_logouts(self) -> Dict[str, Datetime]:
+        """|coro|
+
+        Fetches the last logout of all friends with a single request and
+        updates :attr:`Friend.last_logout` for every cached friend.
+
+        Concurrent calls share the same request.
+
+        Raises
+        ------
+        HTTPException
+            An error occured while requesting.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`datetime.datetime`]
+            Mapping of friend ids to the UTC time of their last logout.
+            Friends that have never logged into fortnite are not included.
+        """
+        return dict(await self._fetch_last_logouts_shared())
+
+    async def _fetch_last_logouts_shared(self) -> Dict[str, Datetime]:
+        # The returned mapping is shared between all concurrent callers and
+        # must not be mutated.
+        task = self._last_logouts_task
+        if task is None:
+            task = self.loop.create_task(self._fetch_all_last_logouts())
+            task.add_done_callback(self._clear_last_logouts_task)
+            self._last_logouts_task = task
+
+        return await asyncio.shield(task)
+
+    def _clear_last_logouts_task(self, task: asyncio.Task) -> None:
+        if self._last_logouts_task is task:
+            self._last_logouts_task = None
+
     def store_user(self, data: dict, *, try_cache: bool = True) -> User:
         try:
             user_id = data.get(
@@ -24,77 +24,142 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-import datetime
+import asyncio
+import functools
 
-from typing import TYPE_CHECKING, List, Optional
+from datetime import datetime as _dt
+from operator import attrgetter
+from typing import (TYPE_CHECKING, Any, Awaitable, Callable, Optional,
+                    Tuple)
 from aioxmpp import JID
 
-from .user import UserBase, ExternalAuth
+from .user import UserBase
 from .errors import PartyError, Forbidden, HTTPException
 from .presence import Presence
 from .enums import Platform
 
+try:
+    from typing import final
+except ImportError:  # python < 3.8
+    def final(f):
+        return f
+
 if TYPE_CHECKING:
     from .client import Client
     from .party import ClientParty
 
-# Type defs
-Datetime = datetime.datetime
+# Attribute lookups on the classes below rely on the interpreter's type
+# attribute cache, which is invalidated whenever a class is modified. Do not
+# setattr or otherwise patch these classes at runtime; subclass them instead.
+
+_len = len
+
+_IGNORED_NICKNAME_NOTE_ERRORS = frozenset((
+    'errors.com.epicgames.common.unsupported_media_type',
+    'errors.com.epicgames.validation.validation_failed',
+))
 
 
 class FriendBase(UserBase):
 
-    __slots__ = UserBase.__slots__ + \
-                ('_status', '_direction', '_favorite', '_created_at')
+    __slots__ = ('_status', '_direction', '_favorite', '_created_at',
+                 '_from_iso', '_inflight')
 
     def __init__(self, client: 'Client', data: dict) -> None:
+        self._status = None
+        self._direction = None
+        self._created_at = None
+        self._favorite = None
+        self._from_iso = client.from_iso
+        self._inflight = None
         super().__init__(client, data)
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if '__slots__' not in cls.__dict__:
+            raise TypeError('{0} must define __slots__'.format(cls.__name__))
+
     def _update(self, data: dict) -> None:
         super()._update(data)
         self._status = data['status']
         self._direction = data['direction']
-        self._created_at = self.client.from_iso(data['created'])
-
-    @property
-    def display_name(self) -> str:
-        """:class:`str`: The friend's displayname"""
-        return super().display_name
-
-    @property
-    def id(self) -> str:
-        """:class:`str`: The friend's id"""
-        return self._id
-
-    @property
-    def external_auths(self) -> List[ExternalAuth]:
-        """:class:`list`: List containing information about external auths.
-        Might be empty if the friend does not have any external auths"""
-        return self._external_auths
+        self._created_at = self._from_iso(data['created'])
+
+    async def _deduplicate(self, key: str, value: Any,
+                           func: Callable[..., Awaitable[Any]],
+                           *args: Any) -> Any:
+        # Concurrent calls with the same key and value await the same
+        # request instead of each sending their own. Any other call for the
+        # key replaces the entry so later callers never join a request
+        # that has since been superseded.
+        inflight = self._inflight
+        if inflight is None:
+            inflight = self._inflight = {}
+
+        entry = inflight.get(key)
+        if entry is not None and entry[0] == value:
+            task = entry[1]
+        else:
+            task = self.client.loop.create_task(func(*args))
+            task.add_done_callback(
+                functools.partial(self._clear_inflight, key)
+            )
+            inflight[key] = (value, task)
+
+        return await asyncio.shield(task)
+
+    def _clear_inflight(self, key: str, task: asyncio.Task) -> None:
+        # A superseded task can finish after the task that replaced it has
+        # already emptied and dropped the map.
+        inflight = self._inflight
+        if inflight is None:
+            return
+
+        entry = inflight.get(key)
+        if entry is not None and entry[1] is task:
+            del inflight[key]
+            if not inflight:
+                self._inflight = None
+
+    display_name = property(
+        UserBase.display_name.fget,
+        doc=""":class:`str`: The friend's displayname""",
+    )
+
+    id = property(
+        attrgetter('_id'),
+        doc=""":class:`str`: The friend's id""",
+    )
+
+    external_auths = property(
+        attrgetter('_external_auths'),
+        doc=""":class:`list`: List containing information about external auths.
+        Might be empty if the friend does not have any external auths""",
+    )
 
     @property
     def jid(self) -> JID:
         """:class:`aioxmpp.JID`: The jid of the friend."""
         return super().jid
 
-    @property
-    def status(self) -> str:
-        """:class:`str`: The friends status to the client. E.g. if the friend
-        is friends with the bot it will be ``ACCEPTED``.
+    status = property(
+        attrgetter('_status'),
+        doc=""":class:`str`: The friends status to the client. E.g. if the
+        friend is friends with the bot it will be ``ACCEPTED``.
 
         .. warning::
 
             This is not the same as status from presence!
 
-        """
-        return self._status
+        """,
+    )
 
-    @property
-    def direction(self) -> str:
-        """:class:`str`: The direction of the friendship. ``INBOUND`` if the friend
-        added :class:`ClientUser` else ``OUTGOING``.
-        """
-        return self._direction
+    direction = property(
+        attrgetter('_direction'),
+        doc=""":class:`str`: The direction of the friendship. ``INBOUND`` if
+        the friend added :class:`ClientUser` else ``OUTGOING``.
+        """,
+    )
 
     @property
     def inbound(self) -> bool:
@@ -110,12 +175,12 @@ class FriendBase(UserBase):
         """
         return self._direction == 'OUTGOING'
 
-    @property
-    def created_at(self) -> Datetime:
-        """:class:`datetime.datetime`: The UTC time of when the friendship was
-        created.
-        """
-        return self._created_at
+    created_at = property(
+        attrgetter('_created_at'),
+        doc=""":class:`datetime.datetime`: The UTC time of when the
+        friendship was created.
+        """,
+    )
 
     async def block(self) -> None:
         """|coro|
@@ -127,110 +192,123 @@ class FriendBase(UserBase):
         HTTPException
             Something went wrong when trying to block this user.
         """
-        await self.client.block_user(self.id)
+        await self._deduplicate('block', None, self.client.block_user,
+                                self._id)
 
     def get_raw(self) -> dict:
-        return {
-            **(super().get_raw()),
-            'status': self.status,
-            'direction': self.direction,
-            'created': self.created_at
-        }
+        base = super().get_raw()
+        base['status'] = self._status
+        base['direction'] = self._direction
+        base['created'] = self._created_at
+        return base
 
 
 class Friend(FriendBase):
     """Represents a friend on Fortnite"""
 
-    __slots__ = FriendBase.__slots__ + ('_nickname', '_note', '_last_logout')
+    __slots__ = ('_nickname', '_note', '_last_logout', '_get_presence',
+                 '_cached_jid')
 
     def __init__(self, client: 'Client', data: dict) -> None:
-        super().__init__(client, data)
+        self._get_presence = client.get_presence
         self._last_logout = None
         self._nickname = None
         self._note = None
+        self._cached_jid = None
+        super().__init__(client, data)
 
     def __repr__(self) -> str:
-        return ('<Friend id={0.id!r} display_name={0.display_name!r} '
-                'epicgames_account={0.epicgames_account!r}>'.format(self))
+        return ('<Friend id={!r} display_name={!r} '
+                'epicgames_account={!r}>'.format(self._id,
+                                                 self.display_name,
+                                                 self.epicgames_account))
 
     def _update(self, data: dict) -> None:
         super()._update(data)
         self._favorite = data.get('favorite')
 
-    def _update_last_logout(self, dt: Datetime) -> None:
+    def _update_last_logout(self, dt: _dt) -> None:
         self._last_logout = dt
 
     def _update_summary(self, data: dict) -> None:
-        _alias = data['alias']
-        self._nickname = _alias if _alias != '' else None
+        self._nickname = data['alias'] or None
+        self._note = data['note'] or None
 
-        _note = data['note']
-        self._note = _note if _note != '' else None
+    display_name = final(property(
+        UserBase.display_name.fget,
+        doc=""":class:`str`: The friends displayname""",
+    ))
 
-    @property
-    def display_name(self) -> str:
-        """:class:`str`: The friends displayname"""
-        return super().display_name
+    id = final(property(
+        attrgetter('_id'),
+        doc=""":class:`str`: The friends id""",
+    ))
 
     @property
-    def id(self) -> str:
-        """:class:`str`: The friends id"""
-        return self._id
-
-    @property
-    def favorite(self) -> bool:
-        """:class:`bool`: ``True`` if the friend is favorited by :class:`ClientUser`
-        else ``False``.
-        """
-        return self._favorite
-
-    @property
-    def nickname(self) -> Optional[str]:
-        """:class:`str`: The friend's nickname. ``None`` if no nickname is set
-        for this friend.
-        """
-        return self._nickname
-
-    @property
-    def note(self) -> Optional[str]:
-        """:class:`str`: The friend's note. ``None`` if no note is set."""
-        return self._note
-
-    @property
-    def external_auths(self) -> List[ExternalAuth]:
-        """:class:`list`: List containing information about external auths.
+    def jid(self) -> JID:
+        """:class:`aioxmpp.JID`: The jid of the friend."""
+        jid = self._cached_jid
+        if jid is None:
+            jid = self._cached_jid = super().jid
+        return jid
+
+    favorite = property(
+        attrgetter('_favorite'),
+        doc=""":class:`bool`: ``True`` if the friend is favorited by
+        :class:`ClientUser` else ``False``.
+        """,
+    )
+
+    nickname = property(
+        attrgetter('_nickname'),
+        doc=""":class:`str`: The friend's nickname. ``None`` if no nickname is
+        set for this friend.
+        """,
+    )
+
+    note = property(
+        attrgetter('_note'),
+        doc=""":class:`str`: The friend's note. ``None`` if no note is set.""",
+    )
+
+    external_auths = property(
+        attrgetter('_external_auths'),
+        doc=""":class:`list`: List containing information about external auths.
         Might be empty if the friend does not have any external auths
-        """
-        return self._external_auths
+        """,
+    )
 
+    @final
     @property
     def last_presence(self) -> Presence:
         """:class:`Presence`: The last presence retrieved by the
         friend. Might be ``None`` if no presence has been
         received by this friend yet.
         """
-        return self.client.get_presence(self.id)
+        return self._get_presence(self._id)
 
-    @property
-    def last_logout(self) -> Optional[Datetime]:
-        """:class:`datetime.datetime`: The UTC time of the last time this
+    last_logout = property(
+        attrgetter('_last_logout'),
+        doc=""":class:`datetime.datetime`: The UTC time of the last time this
         friend logged off.
         ``None`` if this friend has never logged into fortnite or because
         the friend was added after the client was started. If the latter is the
         case, you can fetch the friends last logout with
         :meth:`Friend.fetch_last_logout()`.
-        """
-        return self._last_logout
+        """,
+    )
 
+    @final
     @property
     def platform(self) -> Optional[Platform]:
         """:class:`Platform`: The platform the friend is currently online on.
         ``None`` if the friend is offline.
         """
-        pres = self.client.get_presence(self.id)
+        pres = self._get_presence(self._id)
         if pres is not None:
             return pres.platform
 
+    @final
     def is_online(self) -> bool:
         """Method to check if a user is currently online.
 
@@ -249,11 +327,30 @@ class Friend(FriendBase):
         :class:`bool`
             ``True`` if the friend is currently online else ``False``.
         """
-        pres = self.client.get_presence(self.id)
+        pres = self._get_presence(self._id)
         if pres is None:
             return False
         return pres.available
 
+    def snapshot(self) -> Tuple[bool, Optional[Platform]]:
+        """Method to check if the friend is online and which platform they
+        are on, using a single presence lookup.
+
+        This is equivalent to calling :meth:`is_online()` and reading
+        :attr:`platform` but only looks up the last received presence once.
+        The same caveats as for :meth:`is_online()` apply.
+
+        Returns
+        -------
+        Tuple[:class:`bool`, Optional[:class:`Platform`]]
+            Whether the friend is currently online and the platform they are
+            online on. The platform is ``None`` if the friend is offline.
+        """
+        pres = self._get_presence(self._id)
+        if pres is None:
+            return False, None
+        return pres.available, pres.platform
+
     async def fetch_last_logout(self):
         """|coro|
 
@@ -270,14 +367,12 @@ class Friend(FriendBase):
             The last UTC datetime of this friends last logout. Could be
             ``None`` if the friend has never logged into fortnite.
         """
-        presences = await self.client.http.presence_get_last_online()
-        presence = presences.get(self.id)
-        if presence is not None:
-            self._update_last_logout(
-                self.client.from_iso(presence[0]['last_online'])
-            )
+        logouts = await self.client._fetch_last_logouts_shared()
+        dt = logouts.get(self._id)
+        if dt is not None:
+            self._update_last_logout(dt)
 
-        return self.last_logout
+        return self._last_logout
 
     async def fetch_mutual_friends_count(self) -> int:
         """|coro|
@@ -294,10 +389,7 @@ class Friend(FriendBase):
         HTTPException
             An error occured while requesting.
         """
-        data = await self.client.http.friends_get_summary()
-        for friend in data['friends']:
-            if friend['accountId'] == self.id:
-                return friend['mutual']
+        return await self.client._fetch_mutual_friends_count(self._id)
 
     async def set_nickname(self, nickname: str) -> None:
         """|coro|
@@ -319,15 +411,18 @@ class Friend(FriendBase):
         HTTPException
             An error occured while requesting.
         """
-        if not (3 <= len(nickname) <= 16):
+        n = _len(nickname)
+        if n < 3 or n > 16:
             raise ValueError('Invalid nickname length')
 
+        await self._deduplicate('nickname', nickname,
+                                self._set_nickname, nickname)
+
+    async def _set_nickname(self, nickname: str) -> None:
         try:
-            await self.client.http.friends_set_nickname(self.id, nickname)
+            await self.client.http.friends_set_nickname(self._id, nickname)
         except HTTPException as e:
-            ignored = ('errors.com.epicgames.common.unsupported_media_type',
-                       'errors.com.epicgames.validation.validation_failed')
-            if e.message_code in ignored:
+            if e.message_code in _IGNORED_NICKNAME_NOTE_ERRORS:
                 raise ValueError('Invalid nickname')
             raise
         self._nickname = nickname
@@ -342,7 +437,10 @@ class Friend(FriendBase):
         HTTPException
             An error occured while requesting.
         """
-        await self.client.http.friends_remove_nickname(self.id)
+        await self._deduplicate('nickname', None, self._remove_nickname)
+
+    async def _remove_nickname(self) -> None:
+        await self.client.http.friends_remove_nickname(self._id)
         self._nickname = None
 
     async def set_note(self, note: str) -> None:
@@ -364,15 +462,17 @@ class Friend(FriendBase):
         HTTPException
             An error occured while requesting.
         """
-        if not (3 <= len(note) <= 255):
+        n = _len(note)
+        if n < 3 or n > 255:
             raise ValueError('Invalid note length')
 
+        await self._deduplicate('note', note, self._set_note, note)
+
+    async def _set_note(self, note: str) -> None:
         try:
-            await self.client.http.friends_set_note(self.id, note)
+            await self.client.http.friends_set_note(self._id, note)
         except HTTPException as e:
-            ignored = ('errors.com.epicgames.common.unsupported_media_type',
-                       'errors.com.epicgames.validation.validation_failed')
-            if e.message_code in ignored:
+            if e.message_code in _IGNORED_NICKNAME_NOTE_ERRORS:
                 raise ValueError('Invalid note')
             raise
         self._note = note
@@ -387,7 +487,10 @@ class Friend(FriendBase):
         HTTPException
             An error occured while requesting.
         """
-        await self.client.http.friends_remove_note(self.id)
+        await self._deduplicate('note', None, self._remove_note)
+
+    async def _remove_note(self) -> None:
+        await self.client.http.friends_remove_note(self._id)
         self._note = None
 
     async def remove(self) -> None:
@@ -400,7 +503,9 @@ class Friend(FriendBase):
         HTTPException
             Something went wrong when trying to remove this friend.
         """
-        await self.client.remove_or_decline_friend(self.id)
+        await self._deduplicate('remove', None,
+                                self.client.remove_or_decline_friend,
+                                self._id)
 
     async def send(self, content: str) -> None:
         """|coro|
@@ -437,10 +542,11 @@ class Friend(FriendBase):
         if _pre is None:
             raise PartyError('Could not join party. Reason: Party not found')
 
-        if _pre.party.private:
+        party = _pre.party
+        if party.private:
             raise Forbidden('Could not join party. Reason: Party is private')
 
-        return await _pre.party.join()
+        return await party.join()
 
     async def invite(self) -> None:
         """|coro|
@@ -462,21 +568,23 @@ class Friend(FriendBase):
 class PendingFriend(FriendBase):
     """Represents a pending friend from Fortnite."""
 
-    __slots__ = FriendBase.__slots__
+    __slots__ = ()
 
     def __init__(self, client: 'Client', data: dict) -> None:
         super().__init__(client, data)
 
     def __repr__(self) -> str:
-        return ('<PendingFriend id={0.id!r} display_name={0.display_name!r} '
-                'epicgames_account={0.epicgames_account!r}>'.format(self))
-
-    @property
-    def created_at(self) -> Datetime:
-        """:class:`datetime.datetime`: The UTC time of when the request was
+        return ('<PendingFriend id={!r} display_name={!r} '
+                'epicgames_account={!r}>'.format(self._id,
+                                                 self.display_name,
+                                                 self.epicgames_account))
+
+    created_at = property(
+        attrgetter('_created_at'),
+        doc=""":class:`datetime.datetime`: The UTC time of when the request was
         created
-        """
-        return self._created_at
+        """,
+    )
 
     async def accept(self) -> Friend:
         """|coro|
@@ -239,7 +239,7 @@ class UserBase:
     def get_raw(self) -> dict:
         return {
             'displayName': self.display_name,
-            'id': self.id,
+            'id': self._id,
             'externalAuths': self._raw_external_auths
         }
 
@@ -355,7 +355,7 @@ class ClientUser(UserBase):
 class User(UserBase):
     """Represents a user from Fortnite"""
 
-    __slots__ = UserBase.__slots__
+    __slots__ = ()
 
     def __init__(self, client: 'Client', data: dict, **kwargs: Any) -> None:
         super().__init__(client, data)
@@ -380,7 +380,7 @@ class User(UserBase):
 class BlockedUser(UserBase):
     """Represents a blocked user from Fortnite"""
 
-    __slots__ = UserBase.__slots__
+    __slots__ = ()
 
     def __init__(self, client: 'Client', data: dict) -> None:
         super().__init__(client, data)